@@ -0,0 +1,18 @@
+"""
+Shared output helper for the layout visualization scripts.
+"""
+
+import sys
+
+def emit(lines):
+    """Write all lines to stdout as one pre-encoded UTF-8 block."""
+    text = "\n".join(lines) + "\n"
+    buffer = getattr(sys.stdout, "buffer", None)
+    if buffer is None:
+        # Redirected to a text-only stream such as io.StringIO
+        sys.stdout.write(text)
+        return
+    # Flush pending text first so earlier output stays in order
+    sys.stdout.flush()
+    buffer.write(text.encode("utf-8"))
+    buffer.flush()
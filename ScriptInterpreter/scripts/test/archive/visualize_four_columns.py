@@ -4,176 +4,221 @@ Visualization tool for the 4-column test screen layout.
 Shows the structure and navigation order.
 """
 
-print("=" * 100)
-print("FOUR COLUMN LAYOUT TEST SCREEN - VISUALIZATION")
-print("=" * 100)
-print()
-
-print("Window Size: 1600 x 700 pixels")
-print("Layout: GridPane with 4 columns, 3 rows")
-print("Horizontal Gap: 20px, Vertical Gap: 15px, Padding: 30px")
-print()
-
-# Layout visualization
-print("┌" + "─" * 98 + "┐")
-print("│  Four Column Layout Test - Item Listeners" + " " * 53 + "[ _ □ X ] │")
-print("├" + "─" * 98 + "┤")
-print("│" + " " * 98 + "│")
-
-# Column headers
-col_width = 23
-print("│  " + "COLUMN 0".ljust(col_width) + "COLUMN 1".ljust(col_width) + 
-      "COLUMN 2".ljust(col_width) + "COLUMN 3".ljust(col_width) + "  │")
-print("│  " + "─" * col_width + "─" * col_width + "─" * col_width + "─" * col_width + "  │")
-
-# Row 0
-print("│  " + "1. First Name".ljust(col_width) + 
-      "4. Quantity [▲▼]".ljust(col_width) + 
-      "7. Category [▼]".ljust(col_width) + 
-      "10. Status [▼]".ljust(col_width) + "  │")
-
-# Row 1
-print("│  " + "2. Last Name".ljust(col_width) + 
-      "5. Price ($) [▲▼]".ljust(col_width) + 
-      "8. Priority [▼]".ljust(col_width) + 
-      "11. Notes".ljust(col_width) + "  │")
-
-# Row 2
-print("│  " + "3. Full Name".ljust(col_width) + 
-      "6. Total ($)".ljust(col_width) + 
-      "9. Category Mirror".ljust(col_width) + 
-      "12. Status Mirror".ljust(col_width) + "  │")
-
-print("│" + " " * 98 + "│")
-print("│  " + "─" * 94 + "  │")
-print("│  " + "BUTTONS:".ljust(98) + "│")
-print("│  " + "13. Update Full Name  14. Calculate Total  15. Sync Category  16. Sync Status  17. Update All".ljust(98) + "│")
-print("│" + " " * 98 + "│")
-print("└" + "─" * 98 + "┘")
-print()
-
-# Navigation order
-print("=" * 100)
-print("NAVIGATION ORDER (Tab Key)")
-print("=" * 100)
-print()
-print("Column 0: 1 → 2 → 3")
-print("    ↓")
-print("Column 1: 4 → 5 → 6")
-print("    ↓")
-print("Column 2: 7 → 8 → 9")
-print("    ↓")
-print("Column 3: 10 → 11 → 12")
-print("    ↓")
-print("Buttons: 13 → 14 → 15 → 16 → 17")
-print()
-
-# Item Listener Features
-print("=" * 100)
-print("ITEM LISTENER FEATURES")
-print("=" * 100)
-print()
-print("1. NAME CALCULATION:")
-print("   Input: First Name + Last Name")
-print("   Output: Full Name")
-print("   Button: 'Update Full Name'")
-print()
-print("2. NUMERIC CALCULATION:")
-print("   Input: Quantity × Price")
-print("   Output: Total")
-print("   Button: 'Calculate Total'")
-print()
-print("3. CATEGORY MIRRORING:")
-print("   Input: Category dropdown")
-print("   Output: Category Mirror field")
-print("   Button: 'Sync Category'")
-print()
-print("4. STATUS MIRRORING:")
-print("   Input: Status dropdown")
-print("   Output: Status Mirror field")
-print("   Button: 'Sync Status'")
-print()
-print("5. UPDATE ALL:")
-print("   Updates all calculated and mirrored fields at once")
-print("   Button: 'Update All'")
-print()
-
-# Layout calculations
-print("=" * 100)
-print("LAYOUT CALCULATIONS")
-print("=" * 100)
-print()
-print("GridPane Position Format: \"row,column\"")
-print()
-print("Column 0 Items:")
-print("  Item 1 (First Name):    layoutPos=\"0,0\", sequence=1")
-print("  Item 2 (Last Name):     layoutPos=\"1,0\", sequence=2")
-print("  Item 3 (Full Name):     layoutPos=\"2,0\", sequence=3")
-print()
-print("Column 1 Items:")
-print("  Item 4 (Quantity):      layoutPos=\"0,1\", sequence=4")
-print("  Item 5 (Price):         layoutPos=\"1,1\", sequence=5")
-print("  Item 6 (Total):         layoutPos=\"2,1\", sequence=6")
-print()
-print("Column 2 Items:")
-print("  Item 7 (Category):      layoutPos=\"0,2\", sequence=7")
-print("  Item 8 (Priority):      layoutPos=\"1,2\", sequence=8")
-print("  Item 9 (Cat Mirror):    layoutPos=\"2,2\", sequence=9")
-print()
-print("Column 3 Items:")
-print("  Item 10 (Status):       layoutPos=\"0,3\", sequence=10")
-print("  Item 11 (Notes):        layoutPos=\"1,3\", sequence=11")
-print("  Item 12 (Status Mirror):layoutPos=\"2,3\", sequence=12")
-print()
-print("Button Area (HBox):")
-print("  Buttons 13-17 with sequences 13-17")
-print()
-
-# Control types
-print("=" * 100)
-print("CONTROL TYPES")
-print("=" * 100)
-print()
-print("TextFields:    First Name, Last Name, Full Name, Total, Notes,")
-print("               Category Mirror, Status Mirror")
-print("Spinners:      Quantity (1-100), Price ($1-$1000)")
-print("ComboBoxes:    Category, Status")
-print("ChoiceBox:     Priority")
-print("Buttons:       5 update buttons")
-print()
-
-# Testing instructions
-print("=" * 100)
-print("TESTING INSTRUCTIONS")
-print("=" * 100)
-print()
-print("1. Run the application:")
-print("   cd ScriptInterpreter")
-print("   mvn javafx:run")
-print()
-print("2. In the console, load the script:")
-print("   /open scripts/test_screen_four_columns.ebs")
-print()
-print("3. Execute with Ctrl+Enter")
-print()
-print("4. Test item listeners:")
-print("   a) Type in First Name and Last Name")
-print("   b) Click 'Update Full Name' button")
-print("   c) Observe Full Name field updates")
-print()
-print("   d) Change Quantity and Price spinners")
-print("   e) Click 'Calculate Total' button")
-print("   f) Observe Total field updates")
-print()
-print("   g) Select different Category from dropdown")
-print("   h) Click 'Sync Category' button")
-print("   i) Observe Category Mirror field updates")
-print()
-print("   j) Select different Status from dropdown")
-print("   k) Click 'Sync Status' button")
-print("   l) Observe Status Mirror field updates")
-print()
-print("5. Test navigation:")
-print("   Press Tab key repeatedly and verify focus moves in order 1→2→3→...→17")
-print()
-print("=" * 100)
+from visualize_common import emit
+
+# Repeated separators and padding, built once
+COL_W = 23
+DASHES_COL = "─" * COL_W
+DASHES_98 = "─" * 98
+DASHES_94 = "─" * 94
+SPACES_98 = " " * 98
+EQ_100 = "=" * 100
+
+# Window frame lines
+BOX_TOP = "┌" + DASHES_98 + "┐"
+BOX_DIVIDER = "├" + DASHES_98 + "┤"
+BOX_BLANK = "│" + SPACES_98 + "│"
+BOX_BOTTOM = "└" + DASHES_98 + "┘"
+HEADER_SEP = "│  " + DASHES_COL * 4 + "  │"
+BUTTONS_SEP = "│  " + DASHES_94 + "  │"
+
+# Title padded to the frame interior, less the indent and window buttons.
+# The original title bar overran the frame by TITLE_OVERRUN characters;
+# the overrun is kept so the output stays identical.
+TITLE = "Four Column Layout Test - Item Listeners"
+TITLE_BUTTONS = "[ _ □ X ] "
+TITLE_OVERRUN = 7
+TITLE_W = len(SPACES_98) - 2 - len(TITLE_BUTTONS) + TITLE_OVERRUN
+TITLE_BAR = f"│  {TITLE:<{TITLE_W}}{TITLE_BUTTONS}│"
+BUTTONS_LABEL = "│  " + "BUTTONS:".ljust(98) + "│"
+BUTTONS_LINE = ("│  " + "13. Update Full Name  14. Calculate Total  15. Sync Category  "
+                "16. Sync Status  17. Update All".ljust(98) + "│")
+
+# One grid row: four left-aligned cells of COL_W characters each
+ROW_FMT = "│  " + ("{:<%d}" % COL_W) * 4 + "  │"
+
+# Static text sections, each built once at import
+NAVIGATION_BLOCK = f"""\
+{EQ_100}
+NAVIGATION ORDER (Tab Key)
+{EQ_100}
+
+Column 0: 1 → 2 → 3
+    ↓
+Column 1: 4 → 5 → 6
+    ↓
+Column 2: 7 → 8 → 9
+    ↓
+Column 3: 10 → 11 → 12
+    ↓
+Buttons: 13 → 14 → 15 → 16 → 17
+"""
+
+FEATURES_BLOCK = f"""\
+{EQ_100}
+ITEM LISTENER FEATURES
+{EQ_100}
+
+1. NAME CALCULATION:
+   Input: First Name + Last Name
+   Output: Full Name
+   Button: 'Update Full Name'
+
+2. NUMERIC CALCULATION:
+   Input: Quantity × Price
+   Output: Total
+   Button: 'Calculate Total'
+
+3. CATEGORY MIRRORING:
+   Input: Category dropdown
+   Output: Category Mirror field
+   Button: 'Sync Category'
+
+4. STATUS MIRRORING:
+   Input: Status dropdown
+   Output: Status Mirror field
+   Button: 'Sync Status'
+
+5. UPDATE ALL:
+   Updates all calculated and mirrored fields at once
+   Button: 'Update All'
+"""
+
+LAYOUT_BLOCK = f"""\
+{EQ_100}
+LAYOUT CALCULATIONS
+{EQ_100}
+
+GridPane Position Format: "row,column"
+
+Column 0 Items:
+  Item 1 (First Name):    layoutPos="0,0", sequence=1
+  Item 2 (Last Name):     layoutPos="1,0", sequence=2
+  Item 3 (Full Name):     layoutPos="2,0", sequence=3
+
+Column 1 Items:
+  Item 4 (Quantity):      layoutPos="0,1", sequence=4
+  Item 5 (Price):         layoutPos="1,1", sequence=5
+  Item 6 (Total):         layoutPos="2,1", sequence=6
+
+Column 2 Items:
+  Item 7 (Category):      layoutPos="0,2", sequence=7
+  Item 8 (Priority):      layoutPos="1,2", sequence=8
+  Item 9 (Cat Mirror):    layoutPos="2,2", sequence=9
+
+Column 3 Items:
+  Item 10 (Status):       layoutPos="0,3", sequence=10
+  Item 11 (Notes):        layoutPos="1,3", sequence=11
+  Item 12 (Status Mirror):layoutPos="2,3", sequence=12
+
+Button Area (HBox):
+  Buttons 13-17 with sequences 13-17
+"""
+
+CONTROLS_BLOCK = f"""\
+{EQ_100}
+CONTROL TYPES
+{EQ_100}
+
+TextFields:    First Name, Last Name, Full Name, Total, Notes,
+               Category Mirror, Status Mirror
+Spinners:      Quantity (1-100), Price ($1-$1000)
+ComboBoxes:    Category, Status
+ChoiceBox:     Priority
+Buttons:       5 update buttons
+"""
+
+TESTING_BLOCK = f"""\
+{EQ_100}
+TESTING INSTRUCTIONS
+{EQ_100}
+
+1. Run the application:
+   cd ScriptInterpreter
+   mvn javafx:run
+
+2. In the console, load the script:
+   /open scripts/test_screen_four_columns.ebs
+
+3. Execute with Ctrl+Enter
+
+4. Test item listeners:
+   a) Type in First Name and Last Name
+   b) Click 'Update Full Name' button
+   c) Observe Full Name field updates
+
+   d) Change Quantity and Price spinners
+   e) Click 'Calculate Total' button
+   f) Observe Total field updates
+
+   g) Select different Category from dropdown
+   h) Click 'Sync Category' button
+   i) Observe Category Mirror field updates
+
+   j) Select different Status from dropdown
+   k) Click 'Sync Status' button
+   l) Observe Status Mirror field updates
+
+5. Test navigation:
+   Press Tab key repeatedly and verify focus moves in order 1→2→3→...→17
+
+{EQ_100}"""
+
+
+def main():
+    # Collect every line and emit them with a single write at the end
+    lines = []
+
+    lines.append(EQ_100)
+    lines.append("FOUR COLUMN LAYOUT TEST SCREEN - VISUALIZATION")
+    lines.append(EQ_100)
+    lines.append("")
+
+    lines.append("Window Size: 1600 x 700 pixels")
+    lines.append("Layout: GridPane with 4 columns, 3 rows")
+    lines.append("Horizontal Gap: 20px, Vertical Gap: 15px, Padding: 30px")
+    lines.append("")
+
+    # Layout visualization
+    lines.append(BOX_TOP)
+    lines.append(TITLE_BAR)
+    lines.append(BOX_DIVIDER)
+    lines.append(BOX_BLANK)
+
+    # Column headers
+    lines.append(ROW_FMT.format("COLUMN 0", "COLUMN 1", "COLUMN 2", "COLUMN 3"))
+    lines.append(HEADER_SEP)
+
+    # Rows 0-2
+    lines.append(ROW_FMT.format("1. First Name", "4. Quantity [▲▼]", "7. Category [▼]", "10. Status [▼]"))
+    lines.append(ROW_FMT.format("2. Last Name", "5. Price ($) [▲▼]", "8. Priority [▼]", "11. Notes"))
+    lines.append(ROW_FMT.format("3. Full Name", "6. Total ($)", "9. Category Mirror", "12. Status Mirror"))
+
+    lines.append(BOX_BLANK)
+    lines.append(BUTTONS_SEP)
+    lines.append(BUTTONS_LABEL)
+    lines.append(BUTTONS_LINE)
+    lines.append(BOX_BLANK)
+    lines.append(BOX_BOTTOM)
+    lines.append("")
+
+    # Navigation order
+    lines.append(NAVIGATION_BLOCK)
+
+    # Item Listener Features
+    lines.append(FEATURES_BLOCK)
+
+    # Layout calculations
+    lines.append(LAYOUT_BLOCK)
+
+    # Control types
+    lines.append(CONTROLS_BLOCK)
+
+    # Testing instructions
+    lines.append(TESTING_BLOCK)
+
+    emit(lines)
+
+
+if __name__ == "__main__":
+    main()
@@ -4,95 +4,115 @@ Visual representation of the two-column test screen layout.
 This script generates an ASCII art representation of the screen layout.
 """
 
+from visualize_common import emit
+
+EQ_80 = "=" * 80
+
+# Field definitions: (sequence, label, control type, prompt text)
+LEFT_COLUMN = [
+    ("1", "First Name", "TextField", "Enter first name"),
+    ("2", "Last Name", "TextField", "Enter last name"),
+    ("3", "Email", "TextField", "Enter email address"),
+    ("4", "Phone", "TextField", "Enter phone number"),
+    ("5", "Age", "Spinner", "18-100")
+]
+
+RIGHT_COLUMN = [
+    ("6", "Address", "TextField", "Enter address"),
+    ("7", "City", "TextField", "Enter city"),
+    ("8", "State", "ComboBox", "Select state"),
+    ("9", "Zip Code", "TextField", "Enter zip code"),
+    ("10", "Country", "ChoiceBox", "USA, Canada, ...")
+]
+
+# Navigation arrows per item: the left column hands over to the right,
+# the right column ends the tab order
+LEFT_ARROWS = ("   ↓",) * (len(LEFT_COLUMN) - 1) + ("   └→",)
+RIGHT_ARROWS = ("   ↓",) * (len(RIGHT_COLUMN) - 1) + ("",)
+
+# Frame lines, built from the width of each column's interior
+INNER_W = 35
+FRAME_TOP = "┏" + "━" * INNER_W + "┳" + "━" * INNER_W + "┓"
+FRAME_DIVIDER = "┣" + "━" * INNER_W + "╋" + "━" * INNER_W + "┫"
+FRAME_BOTTOM = "┗" + "━" * INNER_W + "┻" + "━" * INNER_W + "┛"
+COLUMN_HEADERS = "┃{:<{w}}┃{:<{w}}┃".format(
+    "     LEFT COLUMN (Column 0)", "     RIGHT COLUMN (Column 1)", w=INNER_W)
+
+# Each grid line holds two cells, one per column
+ROW_TMPL = "┃ {lcell:<%d}┃ {rcell:<%d}┃" % (INNER_W, INNER_W)
+
+def format_row(left, right):
+    """Return the field line and the prompt line for one row of the grid."""
+    fields = {
+        "lcell": f"{left[0]}. {left[1]:12} [{left[2]:10}]",
+        "rcell": f"{right[0]}. {right[1]:12} [{right[2]:10}]",
+    }
+    prompts = {"lcell": f"  '{left[3]}'", "rcell": f"  '{right[3]}'"}
+    return (ROW_TMPL.format_map(fields), ROW_TMPL.format_map(prompts))
+
+# The columns never change, so format every row once at import time
+PRECOMPUTED_ROWS = [format_row(l, r) for l, r in zip(LEFT_COLUMN, RIGHT_COLUMN)]
+ROW_SPACER = "┃" + " " * INNER_W + "┃" + " " * INNER_W + "┃"
+GRID_BODY = ("\n" + ROW_SPACER + "\n").join("\n".join(row) for row in PRECOMPUTED_ROWS)
+
+# Tab order listing, also fixed
+LEFT_NAV_LINES = [f"  [{seq}] {field:12} ({ctrl}){arrow}"
+                  for (seq, field, ctrl, _), arrow in zip(LEFT_COLUMN, LEFT_ARROWS)]
+RIGHT_NAV_LINES = [f"  [{seq}] {field:12} ({ctrl}){arrow}"
+                   for (seq, field, ctrl, _), arrow in zip(RIGHT_COLUMN, RIGHT_ARROWS)]
+
 def draw_screen():
-    print("=" * 80)
-    print("  Two Column Layout Test Screen - Navigation Demonstration")
-    print("=" * 80)
-    print()
-    print("Window Size: 800 x 600 pixels")
-    print("Layout: GridPane with 2 columns, 5 rows")
-    print("Horizontal Gap: 20px  |  Vertical Gap: 15px  |  Padding: 30px")
-    print()
-    print("=" * 80)
-    print()
-    
-    # Define fields
-    left_column = [
-        ("1", "First Name", "TextField", "Enter first name"),
-        ("2", "Last Name", "TextField", "Enter last name"),
-        ("3", "Email", "TextField", "Enter email address"),
-        ("4", "Phone", "TextField", "Enter phone number"),
-        ("5", "Age", "Spinner", "18-100")
-    ]
+    lines = []
     
-    right_column = [
-        ("6", "Address", "TextField", "Enter address"),
-        ("7", "City", "TextField", "Enter city"),
-        ("8", "State", "ComboBox", "Select state"),
-        ("9", "Zip Code", "TextField", "Enter zip code"),
-        ("10", "Country", "ChoiceBox", "USA, Canada, ...")
-    ]
+    lines.append(EQ_80)
+    lines.append("  Two Column Layout Test Screen - Navigation Demonstration")
+    lines.append(EQ_80)
+    lines.append("")
+    lines.append("Window Size: 800 x 600 pixels")
+    lines.append("Layout: GridPane with 2 columns, 5 rows")
+    lines.append("Horizontal Gap: 20px  |  Vertical Gap: 15px  |  Padding: 30px")
+    lines.append("")
+    lines.append(EQ_80)
+    lines.append("")
     
-    print("┏━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━┳━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━┓")
-    print("┃     LEFT COLUMN (Column 0)        ┃     RIGHT COLUMN (Column 1)       ┃")
-    print("┣━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━╋━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━┫")
+    lines.append(FRAME_TOP)
+    lines.append(COLUMN_HEADERS)
+    lines.append(FRAME_DIVIDER)
     
-    for i in range(5):
-        left = left_column[i]
-        right = right_column[i]
-        
-        # Format row
-        left_text = f"┃ {left[0]}. {left[1]:12} [{left[2]:10}]"
-        right_text = f"┃ {right[0]}. {right[1]:12} [{right[2]:10}]"
-        
-        # Pad to align
-        left_text = left_text + " " * (37 - len(left_text))
-        right_text = right_text + " " * (37 - len(right_text))
-        
-        print(f"{left_text}{right_text}┃")
-        
-        # Show prompt text below
-        left_prompt = f"┃   '{left[3]}'".ljust(37)
-        right_prompt = f"┃   '{right[3]}'".ljust(37)
-        print(f"{left_prompt}{right_prompt}┃")
-        
-        if i < 4:
-            print("┃" + " " * 35 + "┃" + " " * 35 + "┃")
+    lines.append(GRID_BODY)
     
-    print("┗━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━┻━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━┛")
-    print()
+    lines.append(FRAME_BOTTOM)
+    lines.append("")
     
     # Navigation flow
-    print("=" * 80)
-    print("  TAB NAVIGATION ORDER (Top-to-Bottom, Left Column First)")
-    print("=" * 80)
-    print()
-    print("Left Column (Items 1-5):")
-    for seq, field, ctrl, _ in left_column:
-        arrow = "   ↓" if seq != "5" else "   └→"
-        print(f"  [{seq}] {field:12} ({ctrl}){arrow}")
+    lines.append(EQ_80)
+    lines.append("  TAB NAVIGATION ORDER (Top-to-Bottom, Left Column First)")
+    lines.append(EQ_80)
+    lines.append("")
+    lines.append("Left Column (Items 1-5):")
+    lines.extend(LEFT_NAV_LINES)
+    
+    lines.append("")
+    lines.append("Right Column (Items 6-10):")
+    lines.extend(RIGHT_NAV_LINES)
     
-    print()
-    print("Right Column (Items 6-10):")
-    for seq, field, ctrl, _ in right_column:
-        arrow = "   ↓" if seq != "10" else ""
-        print(f"  [{seq}] {field:12} ({ctrl}){arrow}")
+    lines.append("")
+    lines.append(EQ_80)
+    lines.append("  KEY FEATURES")
+    lines.append(EQ_80)
+    lines.append("")
+    lines.append("✓ Two-column layout with GridPane")
+    lines.append("✓ All items fit on screen (800x600 window)")
+    lines.append("✓ Navigation flows top-to-bottom in left column first")
+    lines.append("✓ Then continues top-to-bottom in right column")
+    lines.append("✓ Each field has proper labels and prompt text")
+    lines.append("✓ Mix of control types: TextField, Spinner, ComboBox, ChoiceBox")
+    lines.append("✓ Consistent sizing: all controls are 300px wide")
+    lines.append("✓ Proper spacing: 20px horizontal gap, 15px vertical gap")
+    lines.append("")
+    lines.append(EQ_80)
     
-    print()
-    print("=" * 80)
-    print("  KEY FEATURES")
-    print("=" * 80)
-    print()
-    print("✓ Two-column layout with GridPane")
-    print("✓ All items fit on screen (800x600 window)")
-    print("✓ Navigation flows top-to-bottom in left column first")
-    print("✓ Then continues top-to-bottom in right column")
-    print("✓ Each field has proper labels and prompt text")
-    print("✓ Mix of control types: TextField, Spinner, ComboBox, ChoiceBox")
-    print("✓ Consistent sizing: all controls are 300px wide")
-    print("✓ Proper spacing: 20px horizontal gap, 15px vertical gap")
-    print()
-    print("=" * 80)
+    emit(lines)
 
 if __name__ == "__main__":
     draw_screen()